@@ -9,11 +9,18 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolve the API keys location once per process
+_SECRETS_PATH = os.environ.get("SECRETS_PATH") or os.path.expanduser("~/.secrets/schmagent")
+_API_KEYS_FILE = os.path.join(_SECRETS_PATH, os.environ.get("API_KEYS_FILE", "api_keys.json"))
+
 def check_api_keys():
     """Check if API keys file exists."""
-    secrets_path = os.getenv("SECRETS_PATH", os.path.expanduser("~/.secrets/schmagent"))
-    api_keys_file = os.path.join(secrets_path, os.getenv("API_KEYS_FILE", "api_keys.json"))
-    return os.path.exists(api_keys_file)
+    try:
+        os.stat(_API_KEYS_FILE)
+        return True
+    except OSError:
+        # As with os.path.exists, an unreadable or invalid path counts as missing
+        return False
 
 if __name__ == "__main__":
     # Detect Cursor IDE environment by checking for encodings import issue
@@ -0,0 +1,28 @@
+# schmagent/__init__.py
+"""Schmagent - A GTK-based chat application."""
+
+import importlib
+
+# Public names and the modules defining them; each is imported on first access
+_LAZY_EXPORTS = {
+    "Message": ".models.chat_model",
+    "OpenAIModel": ".models.openai",
+    "ClipboardManager": ".ui.clipboard",
+    "SchmagentWindow": ".ui.window",
+    "SchmagentApplication": "._app",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    """Import public names lazily so 'import schmagent' doesn't load GTK or httpx."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include the lazily exported names in dir(schmagent)."""
+    return sorted(set(globals()) | set(__all__))
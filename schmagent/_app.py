@@ -0,0 +1,146 @@
+# schmagent/_app.py
+"""Application class and entry point shared by schmagent.main and python -m schmagent."""
+
+import sys
+import logging
+import signal
+
+from .prompts import SYSTEM_MESSAGE, SYSTEM_PROMPT  # noqa: F401 - SYSTEM_PROMPT re-exported for existing imports
+from .utils.config import get_config
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def _create_application_class():
+    """
+    Build the SchmagentApplication class on first use.
+    
+    The GTK/libadwaita stack is imported here rather than at module level so that
+    importing this module (or failing early) does not pay for loading the typelibs.
+    """
+    import gi
+    gi.require_version('Gtk', '4.0')
+    gi.require_version('Adw', '1')
+    from gi.repository import Adw, Gio
+    
+    class SchmagentApplication(Adw.Application):
+        """Main application class for Schmagent."""
+
+        def __init__(self):
+            """Initialize the application."""
+            from .ui.clipboard import ClipboardManager
+
+            super().__init__(
+                application_id="org.gnome.Schmagent",
+                flags=Gio.ApplicationFlags.FLAGS_NONE
+            )
+
+            config = get_config()
+
+            # Set up logging based on configuration
+            log_level_str = config.get("app", "log_level", "INFO")
+            log_level = logging.getLevelNamesMapping().get(log_level_str.upper(), logging.INFO)
+            logging.basicConfig(
+                level=log_level,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+
+            # Initialize properties
+            self.window = None
+            self.chat_model = None
+
+            # Initialize clipboard manager
+            try:
+                self.clipboard_manager = ClipboardManager(config)
+                logger.debug("Clipboard manager initialized: %s", self.clipboard_manager)
+            except Exception as e:
+                logger.error(f"Failed to initialize clipboard manager: {str(e)}")
+                self.clipboard_manager = None
+
+            # Connect signals
+            self.connect("activate", self.on_activate)
+
+            logger.info("Schmagent application initialized")
+
+        def on_activate(self, app):
+            """Handle application activation."""
+            from .ui.window import SchmagentWindow
+
+            # Initialize the chat model
+            self.initialize_chat_model()
+
+            # Create the main window
+            self.window = SchmagentWindow(self)
+            self.window.set_chat_model(self.chat_model)
+
+            # Set the clipboard manager
+            if self.clipboard_manager:
+                self.window.set_clipboard_manager(self.clipboard_manager)
+            else:
+                logger.warning("Clipboard manager is not available, paste will be disabled")
+            self.window.present()
+
+            logger.info("Schmagent window created and presented")
+
+        def initialize_chat_model(self):
+            """Initialize the chat model based on configuration."""
+            from .models.openai import OpenAIModel
+
+            config = get_config()
+            provider = config.get("model", "default", "openai")
+
+            # For now, we only implement OpenAI
+            if provider == "openai":
+                self.chat_model = OpenAIModel(config)
+            else:
+                logger.warning(f"Provider {provider} not implemented yet, falling back to OpenAI")
+                self.chat_model = OpenAIModel(config)
+
+            # Set the system prompt
+            self.chat_model.set_system_prompt(SYSTEM_MESSAGE)
+
+            logger.info(f"Chat model initialized: {provider}")
+    
+    return SchmagentApplication
+
+def _get_application_class():
+    """Return the SchmagentApplication class, building it once per process."""
+    cls = globals().get("SchmagentApplication")
+    if cls is None:
+        cls = _create_application_class()
+        globals()["SchmagentApplication"] = cls
+    return cls
+
+def __getattr__(name):
+    """Lazily expose SchmagentApplication without importing GTK at module import."""
+    if name == "SchmagentApplication":
+        return _get_application_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def main():
+    """Main entry point for the application."""
+    # Run asyncio on top of GLib's main loop so coroutines scheduled by the UI execute
+    import asyncio
+    from gi.events import GLibEventLoopPolicy
+    asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    
+    # Initialize and run the application
+    app = _get_application_class()()
+    
+    # Handle keyboard interrupts gracefully: quit through the main loop so the
+    # cleanup below runs instead of the process being killed outright
+    from gi.repository import GLib
+    
+    def on_sigint():
+        logger.info("Interrupted, shutting down")
+        app.quit()
+        return GLib.SOURCE_CONTINUE
+    
+    GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, on_sigint)
+    
+    try:
+        return app.run(sys.argv)
+    finally:
+        # Close network resources on the loop that created them
+        if app.chat_model is not None:
+            asyncio.get_event_loop().run_until_complete(app.chat_model.aclose())
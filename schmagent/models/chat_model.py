@@ -1,7 +1,7 @@
 # schmagent/models/chat_model.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 class Message:
     """Representation of a chat message."""
     
+    __slots__ = ("role", "content", "_dict")
+    
     def __init__(self, role: str, content: str):
         """
         Initialize a chat message.
@@ -19,13 +21,15 @@ class Message:
         """
         self.role = role
         self.content = content
+        # Messages are not modified after creation, so the dict form is built up front
+        self._dict = {
+            "role": role,
+            "content": content
+        }
         
     def to_dict(self) -> Dict[str, str]:
-        """Convert message to dictionary format."""
-        return {
-            "role": self.role,
-            "content": self.content
-        }
+        """Convert message to dictionary format (shared, do not mutate)."""
+        return self._dict
     
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> 'Message':
@@ -48,6 +52,10 @@ class ChatModel(ABC):
         self.config = config
         self.provider_name = "base"
         self.context_messages = []
+        # Dict form of context_messages, kept in sync so requests don't rebuild it
+        self._context_dicts: List[Dict[str, str]] = []
+        # The system prompt, when set, is always context_messages[0]
+        self._has_system = False
         self.setup()
         
     def setup(self) -> None:
@@ -55,9 +63,21 @@ class ChatModel(ABC):
         pass
     
     @abstractmethod
+    def stream_response(self, messages: List[Message]) -> AsyncIterator[str]:
+        """
+        Stream a response based on the conversation history.
+        
+        Args:
+            messages: A list of Message objects representing the conversation
+            
+        Returns:
+            An async iterator yielding chunks of the model's response as they arrive
+        """
+        pass
+    
     async def generate_response(self, messages: List[Message]) -> str:
         """
-        Generate a response based on the conversation history.
+        Generate a complete response based on the conversation history.
         
         Args:
             messages: A list of Message objects representing the conversation
@@ -65,6 +85,10 @@ class ChatModel(ABC):
         Returns:
             A string containing the model's response
         """
+        return "".join([chunk async for chunk in self.stream_response(messages)])
+    
+    async def aclose(self) -> None:
+        """Release any resources held by the model (e.g. network sessions)."""
         pass
     
     def add_context_message(self, role: str, content: str) -> None:
@@ -75,19 +99,33 @@ class ChatModel(ABC):
             role: The role of the message sender
             content: The text content of the message
         """
-        self.context_messages.append(Message(role, content))
+        if role == "system":
+            logger.warning("System messages belong in set_system_prompt(), replacing the system prompt")
+            self.set_system_prompt(content)
+            return
+        
+        message = Message(role, content)
+        self.context_messages.append(message)
+        self._context_dicts.append(message.to_dict())
     
-    def set_system_prompt(self, prompt: str) -> None:
+    def set_system_prompt(self, prompt: Union[str, Message]) -> None:
         """
         Set the system prompt for the conversation.
         
         Args:
-            prompt: The system prompt text
+            prompt: The system prompt text, or a pre-built system Message to share
         """
-        # Remove any existing system messages
-        self.context_messages = [msg for msg in self.context_messages if msg.role != "system"]
-        # Add the new system prompt
-        self.context_messages.insert(0, Message("system", prompt))
+        message = prompt if isinstance(prompt, Message) else Message("system", prompt)
+        if self._has_system:
+            if self.context_messages[0] is message:
+                return
+            # Replace the existing system prompt in place
+            self.context_messages[0] = message
+            self._context_dicts[0] = message.to_dict()
+        else:
+            self.context_messages.insert(0, message)
+            self._context_dicts.insert(0, message.to_dict())
+            self._has_system = True
     
     def prepare_messages(self, user_messages: List[Message]) -> List[Message]:
         """
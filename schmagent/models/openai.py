@@ -1,11 +1,26 @@
 # schmagent/models/openai.py
 
 import logging
-import asyncio
-from typing import Dict, List, Any, Optional
-import aiohttp
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Any, Optional
 from .chat_model import ChatModel, Message
 
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class OpenAIModel(ChatModel):
@@ -29,63 +44,106 @@ class OpenAIModel(ChatModel):
         self.timeout = self.model_config.get("timeout", 60)
         self.cache_enabled = self.model_config.get("cache_enabled", True)
         
+        # Request fields that don't change between turns
+        self._base_payload = {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": True
+        }
+        
+        # HTTP client, created on first request and reused across turns
+        self._client: Optional["httpx.AsyncClient"] = None
+        
         logger.debug(f"OpenAI model initialized with model: {self.model_name}")
         
-    async def generate_response(self, messages: List[Message]) -> str:
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # Imported here so httpx is only loaded once a request is made
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=4, keepalive_expiry=75),
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}"
+                }
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        
+    async def stream_response(self, messages: List[Message]) -> AsyncIterator[str]:
         """
-        Generate a response from the OpenAI API.
+        Stream a response from the OpenAI API.
         
         Args:
             messages: List of Message objects
             
-        Returns:
-            String response from the model
+        Yields:
+            Chunks of the response text as they are received; a failure before any text
+            arrives is yielded as an error message
+            
+        Raises:
+            Exception: If the request fails after part of the response was yielded
         """
         if not self.api_key:
-            return "Error: OpenAI API key not configured. Please set up your API key."
+            yield "Error: OpenAI API key not configured. Please set up your API key."
+            return
         
-        # Prepare the full message list
-        full_messages = self.prepare_messages(messages)
-        message_dicts = [message.to_dict() for message in full_messages]
+        # Prepare the full message list; context dicts are prebuilt
+        message_dicts = self._context_dicts + [message.to_dict() for message in messages]
         
         # Prepare the API request
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
+        payload = {**self._base_payload, "messages": message_dicts}
         
-        payload = {
-            "model": self.model_name,
-            "messages": message_dicts,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens
-        }
+        import httpx
         
+        streamed = False  # Once text has gone out, errors are raised rather than yielded
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenAI API error: {response.status} - {error_text}")
-                        return f"Error: API request failed with status {response.status}"
-                    
-                    data = await response.json()
+            async with self._get_client().stream(
+                "POST",
+                "https://api.openai.com/v1/chat/completions",
+                content=_json_dumps(payload)
+            ) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode("utf-8", errors="replace")
+                    logger.error(f"OpenAI API error: {response.status_code} - {error_text}")
+                    yield f"Error: API request failed with status {response.status_code}"
+                    return
+                
+                # Server-sent events: one "data: {json}" line per chunk
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
                     
-                    # Extract the assistant's message
-                    if "choices" in data and data["choices"]:
-                        return data["choices"][0]["message"]["content"]
-                    else:
-                        logger.error(f"Unexpected API response format: {data}")
-                        return "Error: Unexpected response format from API"
+                    chunk = _json_loads(data)
+                    choices = chunk.get("choices")
+                    if not choices:
+                        continue
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        streamed = True
+                        yield content
         
-        except asyncio.TimeoutError:
+        except httpx.TimeoutException:
             logger.error(f"OpenAI API request timed out after {self.timeout} seconds")
-            return "Error: Request timed out. Please try again."
+            if streamed:
+                # A yielded error would read as part of the partial answer
+                raise
+            yield "Error: Request timed out. Please try again."
         except Exception as e:
             logger.error(f"Error calling OpenAI API: {str(e)}")
-            return f"Error: {str(e)}"
\ No newline at end of file
+            if streamed:
+                raise
+            yield f"Error: {str(e)}"
@@ -2,12 +2,19 @@
 
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, Gdk, GLib, Gio
+from gi.repository import Gtk, Gdk, GLib
+import asyncio
+import functools
 import logging
 from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+def _resolve_future(future: asyncio.Future, value: Optional[str]) -> None:
+    """Set a future's result unless it was already resolved or cancelled."""
+    if not future.done():
+        future.set_result(value)
+
 class ClipboardManager:
     """Manages clipboard interactions."""
     
@@ -31,28 +38,35 @@ class ClipboardManager:
         Args:
             callback: Function to call with the clipboard text or None
         """
-        print(f"ClipboardManager.get_text called with callback: {callback}")
         try:
             # Create a cancellable object to allow cancelling the operation if needed
             cancellable = None  # Gio.Cancellable() - not needed for simple operations
             
             # Request text from clipboard with proper cancellable and user_data
-            print(f"Calling read_text_async on clipboard: {self.clipboard}")
             self.clipboard.read_text_async(cancellable, self._on_text_received, callback)
-            print("Clipboard read request initiated")
             logger.debug("Clipboard read request initiated")
         except Exception as e:
-            print(f"Could not initiate clipboard access: {str(e)}")
             logger.error(f"Could not initiate clipboard access: {str(e)}")
             callback(None)
     
+    async def get_text_async(self) -> Optional[str]:
+        """
+        Get text from the clipboard, awaiting the result.
+        
+        Returns:
+            The clipboard text, or None if no text is available
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # GTK invokes the callback from its main context; hand the result to the loop safely
+        self.get_text(functools.partial(loop.call_soon_threadsafe, _resolve_future, future))
+        return await future
+    
     def _on_text_received(self, clipboard, result, callback):
         """Handle clipboard text when received."""
-        print(f"ClipboardManager._on_text_received called with result: {result}")
         try:
             # The proper way to finish the async operation and get the text
             text = clipboard.read_text_finish(result)
-            print(f"Clipboard text received: {text}")
             
             if text:
                 logger.debug("Clipboard text received successfully")
@@ -63,17 +77,14 @@ class ClipboardManager:
                     self._schedule_clipboard_clear()
             else:
                 # This is not an error - just means clipboard had no text content
-                print("Clipboard contained no text content")
                 logger.debug("Clipboard contained no text content")
                 callback(None)
                 
         except Exception as e:
             # Handle specific errors
-            print(f"Error reading clipboard: {str(e)}")
             if "Cannot read from empty clipboard" in str(e):
                 # This is a common error in Wayland when clipboard is inaccessible
-                print(f"Clipboard access issue: {str(e)}")
-                logger.debug(f"Clipboard access issue: {str(e)}")
+                logger.debug("Clipboard access issue: %s", e)
                 self._try_clipboard_fallback(callback)
             else:
                 # Real errors should be logged appropriately
@@ -97,13 +108,13 @@ class ClipboardManager:
                 clipboard.read_text_async(None, self._on_primary_text_received, callback)
                 logger.debug("Retrying with regular clipboard")
             except Exception as e:
-                logger.debug(f"Regular clipboard retry failed: {str(e)}")
+                logger.debug("Regular clipboard retry failed: %s", e)
                 
                 # If all else fails, inform the user
                 logger.debug("All clipboard access methods failed")
                 callback(None)
         except Exception as e:
-            logger.debug(f"Primary selection fallback failed: {str(e)}")
+            logger.debug("Primary selection fallback failed: %s", e)
             callback(None)
     
     def _on_primary_text_received(self, clipboard, result, callback):
@@ -117,7 +128,7 @@ class ClipboardManager:
                 logger.debug("No text in primary selection")
                 callback(None)
         except Exception as e:
-            logger.debug(f"Error reading primary selection: {str(e)}")
+            logger.debug("Error reading primary selection: %s", e)
             callback(None)
     
     def set_text(self, text: str) -> None:
@@ -7,32 +7,108 @@
 import gi  # type: ignore
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gdk, Gio  # type: ignore
+from gi.repository import Gtk, Adw, GLib, Gio, GObject  # type: ignore
 import logging
 import asyncio
-from typing import Optional, List
+import inspect
 
 from ..models.chat_model import Message
 from ..utils.config import config
 
 logger = logging.getLogger(__name__)
 
+# Window settings, read once; changing them in the config takes effect on restart
+_WIN_W = config.get("ui", "window_width", 800)
+_WIN_H = config.get("ui", "window_height", 600)
+_APP_NAME = config.get("app", "name", "Schmagent")
+
+# Styling for chat rows; each row is one label carrying chat-role-<role>
+CHAT_CSS = """
+.chat-message {
+    padding: 8px 12px;
+    margin: 5px 0;
+    border-radius: 12px;
+}
+.chat-role-user {
+    margin-left: 48px;
+    background-color: alpha(@accent_bg_color, 0.15);
+}
+.chat-role-assistant {
+    margin-right: 48px;
+    background-color: @card_bg_color;
+}
+.chat-role-thinking {
+    margin-right: 48px;
+    font-style: italic;
+    opacity: 0.6;
+}
+"""
+
+def _with_partial(chunks, error):
+    """Return an error message, after whatever part of the response had streamed in."""
+    partial = "".join(chunks)
+    return f"{partial}\n\n{error}" if partial else error
+
+async def _iterate_blocking(iterator):
+    """Yield from a blocking iterator, advancing it in the default executor."""
+    loop = asyncio.get_running_loop()
+    done = object()
+    while (chunk := await loop.run_in_executor(None, next, iterator, done)) is not done:
+        yield chunk
+
+class MessageItem(GObject.Object):
+    """A message as stored in the chat view's list model."""
+    
+    role = GObject.Property(type=str, default="")
+    content = GObject.Property(type=str, default="")
+    
+    def __init__(self, role: str, content: str):
+        """
+        Initialize a message item.
+        
+        Args:
+            role: The role of the message sender (user, assistant, system, thinking)
+            content: The plain text shown for the message
+        """
+        super().__init__(role=role, content=content)
+
 class SchmagentWindow(Adw.ApplicationWindow):
     """Main application window for Schmagent."""
     
+    _css_provider = None  # Shared by all windows, installed on first construction
+    
     def __init__(self, app, **kwargs):
         """Initialize the main window."""
         super().__init__(
             application=app,
-            default_width=config.get("ui", "window_width", 800),
-            default_height=config.get("ui", "window_height", 600),
-            title=config.get("app", "name", "Schmagent"),
+            default_width=_WIN_W,
+            default_height=_WIN_H,
+            title=_APP_NAME,
             **kwargs
         )
         
+        if SchmagentWindow._css_provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_string(CHAT_CSS)
+            Gtk.StyleContext.add_provider_for_display(
+                self.get_display(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            SchmagentWindow._css_provider = provider
+        
         self.chat_model = None  # Will be set by the application
         self.clipboard_manager = None  # Will be set by the application
         self.messages = []
+        self.thinking_item = None  # List item of the thinking indicator, while shown
+        self.streaming_item = None  # List item of the response being streamed in
+        self._stream_chunks = []  # Streamed text not yet shown
+        self._stream_flush_pending = False  # A flush of _stream_chunks is already queued
+        # The streaming state above serves one response at a time; sending waits for it
+        self._response_pending = False
+        self._scroll_pending = False  # A scroll to the bottom is already queued
+        
+        # The application installs GLib's asyncio policy, so this loop runs with GTK's
+        self._loop = asyncio.get_event_loop()
+        self._pending_tasks = set()  # Strong references so running tasks aren't collected
         
         self.setup_ui()
         
@@ -52,10 +128,17 @@ class SchmagentWindow(Adw.ApplicationWindow):
         # Message display area (scrollable)
         scrolled_window = Gtk.ScrolledWindow()
         scrolled_window.set_vexpand(True)
-        
-        # Message list box
-        self.message_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        scrolled_window.set_child(self.message_box)
+        self.scrolled_window = scrolled_window
+        self._vadj = scrolled_window.get_vadjustment()
+        
+        # Message list; only the visible rows are realized as widgets
+        self.message_store = Gio.ListStore(item_type=MessageItem)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_message_setup)
+        factory.connect("bind", self._on_message_bind)
+        factory.connect("unbind", self._on_message_unbind)
+        self.message_view = Gtk.ListView.new(Gtk.NoSelection.new(self.message_store), factory)
+        scrolled_window.set_child(self.message_view)
         main_box.append(scrolled_window)
         
         # Input area
@@ -90,20 +173,55 @@ class SchmagentWindow(Adw.ApplicationWindow):
         
         main_box.append(input_box)
         
-        # Set the main box as the content of the window
-        self.set_content(main_box)
-        
-        # Connect key press event
-        key_controller = Gtk.EventControllerKey()
-        key_controller.connect("key-pressed", self.on_key_pressed)
-        self.text_input.add_controller(key_controller)
+        # Wrap the main box in a toast overlay and make it the window content
+        self.toast_overlay = Adw.ToastOverlay()
+        self.toast_overlay.set_child(main_box)
+        self.set_content(self.toast_overlay)
+        
+        # Ctrl+Enter sends from anywhere in the window; GTK matches the trigger itself,
+        # so ordinary keystrokes never reach Python
+        self.send_action = Gio.SimpleAction.new("send", None)
+        self.send_action.connect("activate", self.on_send_activated)
+        self.add_action(self.send_action)
+        
+        shortcuts = Gtk.ShortcutController()
+        # Capture phase, so the text view doesn't take Ctrl+Enter as a newline first
+        shortcuts.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        shortcuts.add_shortcut(Gtk.Shortcut.new(
+            Gtk.ShortcutTrigger.parse_string("<Control>Return"),
+            Gtk.NamedAction.new("win.send"),
+        ))
+        self.add_controller(shortcuts)
+    
+    def _on_message_setup(self, factory, list_item):
+        """Create the reusable label for a message row."""
+        list_item.set_child(Gtk.Label(xalign=0, wrap=True, selectable=True))
+    
+    def _on_message_bind(self, factory, list_item):
+        """Fill a message row with the data of the item it now displays."""
+        item = list_item.get_item()
+        label = list_item.get_child()
+        
+        # Content is model/user text, not markup; the label never enables use-markup,
+        # so it skips Pango parsing and can't fail on stray '<' or '&'. The binding
+        # keeps the row current while a response streams in.
+        label._content_binding = item.bind_property(
+            "content", label, "label", GObject.BindingFlags.SYNC_CREATE
+        )
+        # Role styling (alignment, background) comes from CHAT_CSS
+        label.set_css_classes(["chat-message", f"chat-role-{item.role}"])
+    
+    def _on_message_unbind(self, factory, list_item):
+        """Detach a recycled message row from its previous item."""
+        label = list_item.get_child()
+        label._content_binding.unbind()
+        label._content_binding = None
     
     def on_paste_clicked(self, button):
         """Handle the paste button click event."""
-        print(f"Paste button clicked, clipboard_manager: {getattr(self, 'clipboard_manager', None)}")
+        logger.debug("Paste clicked, clipboard_manager=%s", getattr(self, 'clipboard_manager', None))
         
         if not hasattr(self, 'clipboard_manager') or self.clipboard_manager is None:
-            print("No clipboard manager available")
             logger.warning("No clipboard manager available")
             self.show_toast("Clipboard manager not available")
             return
@@ -125,46 +243,22 @@ class SchmagentWindow(Adw.ApplicationWindow):
     
     def show_toast(self, message):
         """Show a toast notification with the given message."""
-        # In GTK4/libadwaita, we need to create a toast and show it
-        # Since we don't have a toast overlay, we'll just log the message
-        # and show it in the message area as a system message
         logger.info(f"Toast message: {message}")
         
-        # Add a temporary message to the UI
-        message_frame = Adw.PreferencesGroup()
-        message_frame.set_title("System")
-        
-        message_label = Gtk.Label()
-        message_label.set_markup(f"<i>{message}</i>")
-        message_label.set_wrap(True)
-        message_label.set_xalign(0)
-        
-        message_frame.add(message_label)
-        self.message_box.append(message_frame)
-        self.scroll_to_bottom()
-        
-        # Remove the message after a few seconds
-        GLib.timeout_add_seconds(3, lambda: self._remove_toast_message(message_frame))
-    
-    def _remove_toast_message(self, message_frame):
-        """Remove a toast message from the UI."""
-        if message_frame in self.message_box:
-            self.message_box.remove(message_frame)
-        return False  # Don't repeat
+        # libadwaita handles the timeout and dismissal
+        self.toast_overlay.add_toast(Adw.Toast.new(message))
     
-    def on_key_pressed(self, controller, keyval, keycode, state):
-        """Handle key press events in the text input."""
-        # Check for Ctrl+Enter to send
-        if keyval == Gdk.KEY_Return and (state & Gdk.ModifierType.CONTROL_MASK):
-            self.on_send_clicked(None)
-            return True
-        return False
+    def on_send_activated(self, action, parameter):
+        """Handle the win.send action (Ctrl+Enter)."""
+        self.on_send_clicked(None)
     
     def on_send_clicked(self, button):
         """Handle the send button click event."""
-        # Get the text from the input
-        start, end = self.buffer.get_bounds()
-        text = self.buffer.get_text(start, end, False)
+        if self._response_pending:
+            return
+        
+        # Get the text from the input in one call, without creating iterators
+        text = self.buffer.props.text
         
         if not text.strip():
             return
@@ -180,105 +274,150 @@ class SchmagentWindow(Adw.ApplicationWindow):
         self.messages.append(user_message)
         
         # Generate a response asynchronously
+        self._response_pending = True
         self.send_button.set_sensitive(False)
+        self.send_action.set_enabled(False)
         self.add_thinking_indicator()
         
-        # Use GLib to run the async function properly in GTK's main loop
-        asyncio.get_event_loop().create_task(self.get_model_response([user_message]))
+        # Schedule the request on the GLib-driven asyncio loop
+        task = self._loop.create_task(self.get_model_response([user_message]))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
     
     async def get_model_response(self, messages):
-        """Get a response from the model asynchronously."""
+        """Stream a response from the model into the UI as it arrives."""
+        chunks = []
         try:
             if not self.chat_model:
-                GLib.idle_add(self.remove_thinking_indicator)
-                GLib.idle_add(lambda: self.add_message_to_ui("assistant", "Error: No AI model configured."))
-                GLib.idle_add(lambda: self.send_button.set_sensitive(True))
+                GLib.idle_add(self._finish_response, "assistant", "Error: No AI model configured.")
                 return
             
-            # Add a timeout to prevent hanging
-            response = await asyncio.wait_for(
-                self.chat_model.generate_response(messages),
-                timeout=30  # 30 second timeout
-            )
+            # Time out if the model goes quiet for 30 seconds, not if the whole answer takes longer
+            async with asyncio.timeout(30) as deadline:
+                # Decide before calling: a synchronous client would stall GTK, so it is
+                # called, and any chunks it returns are pulled, from a worker thread
+                stream_response = self.chat_model.stream_response
+                if inspect.isasyncgenfunction(stream_response):
+                    stream = stream_response(messages)
+                elif inspect.iscoroutinefunction(stream_response):
+                    stream = await stream_response(messages)
+                else:
+                    stream = await self._loop.run_in_executor(None, stream_response, messages)
+                if isinstance(stream, str):
+                    # A complete response rather than chunks
+                    stream = (stream,)
+                if not hasattr(stream, "__aiter__"):
+                    stream = _iterate_blocking(iter(stream))
+                
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    self._queue_stream_chunk(chunk)
+                    deadline.reschedule(self._loop.time() + 30)
+            
+            response = "".join(chunks)
             
-            # Update UI with response
-            GLib.idle_add(self.remove_thinking_indicator)
-            GLib.idle_add(lambda: self.add_message_to_ui("assistant", response))
-            GLib.idle_add(lambda: self.send_button.set_sensitive(True))
+            # Update UI with the complete response
+            GLib.idle_add(self._finish_response, "assistant", response)
             
             # Add to message history
             self.messages.append(Message("assistant", response))
             
         except asyncio.TimeoutError:
             logger.warning("Model response timed out")
-            GLib.idle_add(self.remove_thinking_indicator)
-            GLib.idle_add(lambda: self.add_message_to_ui("assistant", "Error: Request timed out. Please try again."))
-            GLib.idle_add(lambda: self.send_button.set_sensitive(True))
+            GLib.idle_add(self._finish_response, "assistant",
+                          _with_partial(chunks, "Error: Request timed out. Please try again."))
         except Exception as e:
             logger.error(f"Error in model response: {str(e)}")
-            GLib.idle_add(self.remove_thinking_indicator)
-            GLib.idle_add(lambda: self.add_message_to_ui("assistant", f"Error: {str(e)}"))
-            GLib.idle_add(lambda: self.send_button.set_sensitive(True))
+            GLib.idle_add(self._finish_response, "assistant", _with_partial(chunks, f"Error: {str(e)}"))
+    
+    def _queue_stream_chunk(self, chunk):
+        """Buffer a streamed chunk, showing buffered text at most once per main loop pass."""
+        self._stream_chunks.append(chunk)
+        if self._stream_flush_pending:
+            return
+        self._stream_flush_pending = True
+        GLib.idle_add(self._flush_stream)
+    
+    def _flush_stream(self):
+        """Append the buffered chunks to the streaming message (called by idle_add)."""
+        self._stream_flush_pending = False
+        if not self._stream_chunks:
+            return False
+        text = "".join(self._stream_chunks)
+        self._stream_chunks.clear()
+        
+        if self.streaming_item is None:
+            # First text of the response takes the place of the thinking indicator
+            self.remove_thinking_indicator()
+            self.streaming_item = MessageItem("assistant", text)
+            self.message_store.append(self.streaming_item)
+        else:
+            self.streaming_item.content += text
+        self.scroll_to_bottom()
+        return False  # Don't repeat
+    
+    def _finish_response(self, role, content):
+        """Show the final response text and re-enable sending."""
+        # content is the whole response, so anything still buffered is already in it
+        self._stream_chunks.clear()
+        item = self.streaming_item
+        if item is not None:
+            self.streaming_item = None
+            if item.content != content:
+                item.content = content
+            self.scroll_to_bottom()
+        else:
+            self.remove_thinking_indicator()
+            self.add_message_to_ui(role, content)
+        self._response_pending = False
+        self.send_button.set_sensitive(True)
+        self.send_action.set_enabled(True)
+        return False  # Don't repeat
     
     def add_message_to_ui(self, role, content):
         """Add a message to the UI."""
-        # Create message container
-        message_frame = Adw.PreferencesGroup()
-        
-        # Set up styling based on role
-        if role == "user":
-            message_frame.set_title("You")
-        elif role == "assistant":
-            message_frame.set_title("Schmagent")
-        else:
-            message_frame.set_title(role.capitalize())
-        
-        # Create a label for the content with markup
-        content_label = Gtk.Label()
-        content_label.set_markup(content)
-        content_label.set_wrap(True)
-        content_label.set_xalign(0)  # Align text to the left
-        content_label.set_selectable(True)
-        
-        # Add label to the frame
-        message_frame.add(content_label)
-        
-        # Add the message to the message box
-        self.message_box.append(message_frame)
+        # The list view creates or recycles a row for it when it becomes visible
+        self.message_store.append(MessageItem(role, content))
         
         # Scroll to the bottom
         self.scroll_to_bottom()
     
     def add_thinking_indicator(self):
         """Add a thinking indicator while waiting for a response."""
-        self.thinking_frame = Adw.PreferencesGroup()
-        self.thinking_frame.set_title("Schmagent")
-        
-        thinking_label = Gtk.Label()
-        thinking_label.set_markup("<i>Thinking...</i>")
-        thinking_label.set_xalign(0)
-        
-        self.thinking_frame.add(thinking_label)
-        self.message_box.append(self.thinking_frame)
+        self.thinking_item = MessageItem("thinking", "Thinking...")
+        self.message_store.append(self.thinking_item)
         self.scroll_to_bottom()
     
     def remove_thinking_indicator(self):
         """Remove the thinking indicator."""
-        if hasattr(self, 'thinking_frame'):
-            self.message_box.remove(self.thinking_frame)
-            delattr(self, 'thinking_frame')
+        item = self.thinking_item
+        if item is not None:
+            # Nothing is appended while a response is pending, so it is normally the last row
+            last = self.message_store.get_n_items() - 1
+            if last >= 0 and self.message_store.get_item(last) is item:
+                self.message_store.remove(last)
+            else:
+                found, position = self.message_store.find(item)
+                if found:
+                    self.message_store.remove(position)
+            self.thinking_item = None
     
     def scroll_to_bottom(self):
         """Scroll the message area to the bottom."""
-        # Enqueue this for after rendering
-        GLib.idle_add(self._do_scroll_to_bottom)
+        # Enqueue this for after rendering, once per burst of appends
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        GLib.idle_add(self._do_scroll_to_bottom, priority=GLib.PRIORITY_LOW)
     
     def _do_scroll_to_bottom(self):
         """Actually perform the scroll (called by idle_add)."""
-        parent = self.message_box.get_parent()
-        if isinstance(parent, Gtk.ScrolledWindow):
-            adj = parent.get_vadjustment()
-            adj.set_value(adj.get_upper() - adj.get_page_size())
+        self._scroll_pending = False
+        adj = self._vadj
+        target = adj.get_upper() - adj.get_page_size()
+        # Avoid a value-changed emission (and relayout) when already at the bottom
+        if abs(adj.get_value() - target) > 0.5:
+            adj.set_value(target)
         return False  # Don't call again
     
     def set_chat_model(self, model):
@@ -288,7 +427,5 @@ class SchmagentWindow(Adw.ApplicationWindow):
         
     def set_clipboard_manager(self, manager):
         """Set the clipboard manager to use for clipboard operations."""
-        print(f"SchmagentWindow.set_clipboard_manager called with manager: {manager}")
         self.clipboard_manager = manager
-        print(f"SchmagentWindow.clipboard_manager set to: {self.clipboard_manager}")
-        logger.debug("Clipboard manager set")
+        logger.debug("Clipboard manager set: %s", manager)
@@ -9,14 +9,14 @@ This module implements a hierarchical configuration system with the following so
    - Located in the Pydantic model classes (AppSettings, ModelSettings, etc.)
 
 2. FILE-BASED CONFIGURATION: Loaded from JSON files
-   - Main config: ~/.config/schmagent/config.json (or CONFIG_PATH env var)
+   - Main config: ~/.config/schmagent/config.json (or under $XDG_CONFIG_HOME, or CONFIG_PATH env var)
    - API keys: ~/.secrets/schmagent/api_keys.json (or SECRETS_PATH + API_KEYS_FILE env vars)
    - These override the default values
 
 3. ENVIRONMENT VARIABLES: Override both defaults and file-based config
    - Environment variables take highest precedence
    - Naming convention: UPPERCASE with underscores (e.g., OPENAI_API_KEY)
-   - Boolean values: "true"/"false" (case-insensitive)
+   - Boolean values: "true"/"false", "1"/"0" or "yes"/"no" (case-insensitive)
    - Loaded from .env file (if present) and actual environment variables
 
 Configuration is validated using Pydantic models to ensure type safety and consistency.
@@ -24,18 +24,31 @@ The system is designed to be secure, with API keys stored separately from genera
 """
 
 import os
+import copy
 import json
 import logging
+import stat
+import tempfile
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, IO, Union, List, Literal
+from typing import Callable, Dict, Any, Optional, IO, Union, Literal, Set, Tuple, Type, TypeVar
 from os import PathLike
 
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator, field_validator
 
 try:
-    from dotenv import load_dotenv
+    from dotenv import find_dotenv, load_dotenv
 except ImportError:
     # For type checking only
+    def find_dotenv(
+        filename: str = ".env",
+        raise_error_if_not_found: bool = False,
+        usecwd: bool = False
+    ) -> str:
+        """Stub for type checking if dotenv is not available."""
+        return ""
+    
     def load_dotenv(
         dotenv_path: Optional[Union[str, PathLike[str]]] = None,
         stream: Optional[IO[str]] = None,
@@ -47,8 +60,12 @@ except ImportError:
         """Stub for type checking if dotenv is not available."""
         return False
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Handlers are configured by the application (or the embedding program), not on import
 logger = logging.getLogger(__name__)
 
 
@@ -161,6 +178,9 @@ class NotificationSettings(BaseModel):
 
 class ShortcutSettings(BaseModel):
     """Shortcut settings."""
+    # Files may use the "global" alias or the field name that save() writes
+    model_config = ConfigDict(populate_by_name=True)
+    
     global_shortcut: str = Field(default="<Super>s", alias="global")
 
 
@@ -201,6 +221,200 @@ class Settings(BaseModel):
     shortcuts: ShortcutSettings = Field(default_factory=lambda: ShortcutSettings())
 
 
+# Level names ("DEBUG", "INFO", ...) to numeric logging levels
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+# Marks a cache miss where None is a valid cached value
+_MISSING = object()
+
+# Whether the .env file has been loaded in this process
+_DOTENV_LOADED = False
+
+# (config, data, secrets) directory triples already created in this process
+_BOOTSTRAPPED: Set[Tuple[Path, Path, Path]] = set()
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, reading it in one call."""
+    return _json_loads(path.read_bytes())
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _drop_entry(data: Dict[str, Any], loc: Tuple[Union[int, str], ...]) -> bool:
+    """
+    Remove the entry at loc from nested dicts, or its closest enclosing entry.
+    
+    Returns:
+        True if something was removed
+    """
+    for depth in range(len(loc), 0, -1):
+        node: Any = data
+        for key in loc[:depth - 1]:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, dict) and loc[depth - 1] in node:
+            del node[loc[depth - 1]]
+            return True
+    return False
+
+
+def _validate_file_data(model: Type[_ModelT], data: Any, path: Path) -> Tuple[_ModelT, bool]:
+    """
+    Validate the parsed contents of a file, dropping entries that fail validation.
+    
+    Each invalid entry is logged (without its value, which may be a secret) and falls
+    back to its default, so one bad value doesn't discard the rest of the file.
+    
+    Returns:
+        The validated model, and whether the file validated without dropping anything
+    """
+    try:
+        return model.model_validate(data), True
+    except ValidationError as error:
+        errors = error.errors()
+    
+    if not isinstance(data, dict):
+        logger.error("Invalid contents in %s: expected a JSON object", path)
+        return model(), False
+    
+    # Only reached for a broken file, so the copy doesn't cost the common path anything
+    data = copy.deepcopy(data)
+    while True:
+        dropped = False
+        for error in errors:
+            loc = error["loc"]
+            if _drop_entry(data, loc):
+                dropped = True
+                logger.warning("Ignoring invalid value for %s in %s: %s",
+                               ".".join(map(str, loc)), path, error["msg"])
+        if not dropped:
+            logger.error("Invalid contents in %s, using defaults", path)
+            return model(), False
+        try:
+            return model.model_validate(data), False
+        except ValidationError as error:
+            errors = error.errors()
+
+
+def _ensure_dir(path: Path, mode: Optional[int] = None) -> None:
+    """
+    Create a directory if it is missing, optionally making sure it has the given mode.
+    
+    An existing directory costs a single stat.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+        if mode is not None:
+            os.chmod(path, mode)
+        return
+    if mode is not None and stat.S_IMODE(st.st_mode) != mode:
+        os.chmod(path, mode)
+
+
+def _write_atomic(path: Path, data: bytes, mode: int) -> None:
+    """
+    Replace path with data in one rename, so the file is never seen half-written.
+    
+    The temporary file gets its final permissions before it takes the real name.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as file_handle:
+            os.fchmod(file_handle.fileno(), mode)
+            file_handle.write(data)
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# Accepted spellings for boolean environment variables, after casefolding
+_BOOL_VALUES = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("true"/"false", "1"/"0" or "yes"/"no")."""
+    try:
+        return _BOOL_VALUES[value.strip().casefold()]
+    except KeyError:
+        raise ValueError("expected true or false") from None
+
+
+def _parse_positive_int(value: str) -> int:
+    """Parse a positive integer, ignoring a trailing '# comment'."""
+    number = int(value.split('#')[0].strip())
+    if number <= 0:
+        raise ValueError("must be a positive integer")
+    return number
+
+
+def _setter(section: str, field: str) -> Callable[[Settings, Any], None]:
+    """Return a function that sets settings.<section>.<field> (section may be dotted)."""
+    get_section = attrgetter(section)
+    
+    def set_value(settings: Settings, value: Any) -> None:
+        setattr(get_section(settings), field, value)
+    
+    return set_value
+
+
+# Environment variables that override settings, with the setter for each resolved up front
+# Format: ("ENV_VAR_NAME", converter_function or None, setter)
+_ENV_SETTINGS = (
+    # App settings
+    ("APP_NAME", None, _setter("app", "name")),
+    ("DEBUG", _parse_bool, _setter("app", "debug")),
+    ("LOG_LEVEL", None, _setter("app", "log_level")),
+    
+    # Model settings
+    ("DEFAULT_MODEL", None, _setter("model", "default")),
+    ("OPENAI_MODEL", None, _setter("model.openai", "model")),
+    ("OPENAI_TEMPERATURE", float, _setter("model.openai", "temperature")),
+    ("OPENAI_MAX_TOKENS", int, _setter("model.openai", "max_tokens")),
+    
+    # UI settings
+    ("THEME", None, _setter("ui", "theme")),
+    ("WINDOW_WIDTH", int, _setter("ui", "window_width")),
+    ("WINDOW_HEIGHT", int, _setter("ui", "window_height")),
+    ("CODE_HIGHLIGHTING", _parse_bool, _setter("ui", "code_highlighting")),
+    ("ENABLE_SCREENSHOTS", _parse_bool, _setter("ui", "enable_screenshots")),
+    
+    # Session settings
+    ("SESSION_PERSISTENCE", _parse_bool, _setter("session", "persistence")),
+    ("MAX_HISTORY_SESSIONS", int, _setter("session", "max_history_sessions")),
+    ("MESSAGE_HISTORY_LIMIT", int, _setter("session", "message_history_limit")),
+    
+    # Security settings
+    ("API_KEY_ENCRYPTION", _parse_bool, _setter("security", "api_key_encryption")),
+    ("CLIPBOARD_AUTO_CLEAR", _parse_bool, _setter("security", "clipboard_auto_clear")),
+    ("CLIPBOARD_CLEAR_DELAY", _parse_positive_int, _setter("security", "clipboard_clear_delay")),
+    
+    # Notification settings
+    ("ENABLE_NOTIFICATIONS", _parse_bool, _setter("notifications", "enable")),
+    ("NOTIFICATION_SOUND", _parse_bool, _setter("notifications", "sound")),
+    
+    # Shortcut settings (set by attribute name, not the "global" alias)
+    ("GLOBAL_SHORTCUT", None, _setter("shortcuts", "global_shortcut")),
+)
+
+
+# Environment variables that override API key fields: (ENV_VAR_NAME, provider, field)
+_API_KEY_ENV_VARS = (
+    ("OPENAI_API_KEY", "openai", "api_key"),
+    ("ANTHROPIC_API_KEY", "anthropic", "api_key"),
+    ("GOOGLE_API_KEY", "google", "api_key"),
+    ("GOOGLE_PROJECT_ID", "google", "project_id"),
+    ("OPENROUTER_API_KEY", "openrouter", "api_key"),
+    ("PERPLEXITY_API_KEY", "perplexity", "api_key"),
+    ("ELEVENLABS_API_KEY", "elevenlabs", "api_key"),
+)
+
+
 class Config:
     """Configuration manager for Schmagent application."""
     
@@ -213,217 +427,117 @@ class Config:
         2. Configuration files (config.json and api_keys.json)
         3. Environment variables (including from .env file)
         """
-        # Load .env file if it exists (ENVIRONMENT VARIABLES SOURCE)
-        load_dotenv()
-        
-        # Set up paths (can be overridden by environment variables)
-        config_path_default = os.path.expanduser("~/.config/schmagent")
-        data_path_default = os.path.expanduser("~/.local/share/schmagent")
-        secrets_path_default = os.path.expanduser("~/.secrets/schmagent")
-        
-        # Environment variables can override default paths
-        self.config_path = Path(os.getenv("CONFIG_PATH", config_path_default))
-        self.data_path = Path(os.getenv("DATA_PATH", data_path_default))
-        self.secrets_path = Path(os.getenv("SECRETS_PATH", secrets_path_default))
-        
-        # Ensure paths exist
-        self.config_path.mkdir(parents=True, exist_ok=True)
-        self.data_path.mkdir(parents=True, exist_ok=True)
-        self.secrets_path.mkdir(parents=True, exist_ok=True)
-        
-        # Set permissions for secrets directory
-        os.chmod(self.secrets_path, 0o700)
+        # Load .env file if it exists (ENVIRONMENT VARIABLES SOURCE), once per process;
+        # SCHMAGENT_SKIP_DOTENV=1 skips the search when the environment is already set
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            if not os.environ.get("SCHMAGENT_SKIP_DOTENV"):
+                # Searched for the same way load_dotenv() would, but the parser only
+                # runs when a file was found
+                dotenv_path = find_dotenv()
+                if dotenv_path:
+                    load_dotenv(dotenv_path)
+            _DOTENV_LOADED = True
+        
+        # Set up paths (can be overridden by environment variables), resolving the
+        # home directory once and honouring the XDG base directories
+        env = os.environ
+        home = os.path.expanduser("~")
+        config_home = env.get("XDG_CONFIG_HOME") or f"{home}/.config"
+        data_home = env.get("XDG_DATA_HOME") or f"{home}/.local/share"
+        
+        # Environment variables can override default paths; values from .env may
+        # start with "~", which nothing else expands
+        expand = os.path.expanduser
+        self.config_path = Path(expand(env.get("CONFIG_PATH") or f"{config_home}/schmagent"))
+        self.data_path = Path(expand(env.get("DATA_PATH") or f"{data_home}/schmagent"))
+        self.secrets_path = Path(expand(env.get("SECRETS_PATH") or f"{home}/.secrets/schmagent"))
+        
+        # Ensure paths exist, once per process for each set of paths
+        paths = (self.config_path, self.data_path, self.secrets_path)
+        if paths not in _BOOTSTRAPPED:
+            _ensure_dir(self.config_path)
+            _ensure_dir(self.data_path)
+            # The secrets directory is kept private to the user
+            _ensure_dir(self.secrets_path, 0o700)
+            _BOOTSTRAPPED.add(paths)
         
         # Define file paths
         self.config_file = self.config_path / "config.json"
-        api_keys_filename = os.getenv("API_KEYS_FILE", "api_keys.json")
+        api_keys_filename = env.get("API_KEYS_FILE", "api_keys.json")
         self.api_keys_file = self.secrets_path / api_keys_filename
         
         # Initialize configuration
-        # 1. DEFAULT VALUES SOURCE: Start with default values from Pydantic models
-        self.settings = Settings()
-        
-        # 2. FILE-BASED CONFIGURATION SOURCE: Load from config.json
-        self._load_config_file()
+        # 1. DEFAULT VALUES SOURCE: Default values from Pydantic models, overridden by
+        # 2. FILE-BASED CONFIGURATION SOURCE: config.json
+        self.settings = self._load_config_file()
         
         # 3. ENVIRONMENT VARIABLES SOURCE: Override with environment variables
         self._load_environment_variables()
         
-        # Handle API keys separately for security
-        # - Default values from APIKeys model
-        # - File-based values from api_keys.json
-        # - Environment variable overrides
-        self.api_keys = self._load_api_keys()
+        # Handle API keys separately for security, loaded on first use (see api_keys)
+        self._api_keys: Optional[APIKeys] = None
+        # Whether api_keys.json was missing or loaded without losing anything; saving
+        # replaces the whole file, so it is refused otherwise (see save_api_key)
+        self._api_keys_file_intact = True
         
-        # For backward compatibility
-        self.config = self._to_dict(self.settings)
+        # Dictionary view of the settings, built on first use (see config)
+        self._config: Optional[Dict[str, Any]] = None
+        self._api_key_cache: Dict[str, Optional[str]] = {}
         
         # Set log level after configuration is loaded
         self._configure_logging()
 
-    def _load_config_file(self) -> None:
+    @property
+    def api_keys(self) -> APIKeys:
         """
-        Load configuration from config.json if it exists.
+        API keys for all providers, loaded on first access.
         
-        This is the FILE-BASED CONFIGURATION SOURCE that overrides default values
-        but can be overridden by environment variables.
+        - Default values from APIKeys model
+        - File-based values from api_keys.json
+        - Environment variable overrides
         """
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as file_handle:
-                    user_config = json.load(file_handle)
-                    # Update settings with user config
-                    self.settings = self._update_from_dict(self.settings, user_config)
-                    logger.info("Loaded configuration from %s", self.config_file)
-            except (json.JSONDecodeError, IOError) as error:
-                logger.error("Error loading config file: %s", error)
-        else:
-            # Create empty config file if it doesn't exist
-            with open(self.config_file, 'w', encoding='utf-8') as file_handle:
-                json.dump({}, file_handle, indent=2)
-            logger.info("Created empty configuration file at %s", self.config_file)
+        if self._api_keys is None:
+            self._api_keys = self._load_api_keys()
+        return self._api_keys
 
-    def _update_from_dict(self, settings: Any, data: Dict[str, Any]) -> Any:
+    @property
+    def config(self) -> Dict[str, Any]:
         """
-        Update settings from a dictionary, handling nested structures.
+        The settings as a nested dictionary, for backward compatibility.
         
-        Args:
-            settings: The settings object to update
-            data: Dictionary with new values
-            
-        Returns:
-            Updated settings object
+        Built on first access and rebuilt after save(); read settings for live values.
         """
-        if isinstance(settings, BaseModel):
-            # Create a copy of the current model
-            model_copy = settings.model_copy()
-            
-            # Update with new data
-            for key, value in data.items():
-                if hasattr(model_copy, key):
-                    current_value = getattr(model_copy, key)
-                    if isinstance(value, dict) and isinstance(current_value, (BaseModel, dict)):
-                        # Recursively update nested models/dicts
-                        setattr(model_copy, key, self._update_from_dict(current_value, value))
-                    else:
-                        # Direct update for simple values
-                        setattr(model_copy, key, value)
-            
-            return model_copy
-        elif isinstance(settings, dict):
-            # Handle dictionary updates
-            result = settings.copy()
-            for key, value in data.items():
-                if key in result and isinstance(value, dict) and isinstance(result[key], (dict, BaseModel)):
-                    result[key] = self._update_from_dict(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        else:
-            # For other types, just return the new value
-            return data
+        if self._config is None:
+            self._config = self.settings.model_dump()
+        return self._config
 
-    def _to_dict(self, obj: Any) -> Any:
+    def _load_config_file(self) -> Settings:
         """
-        Convert Pydantic models to dictionaries recursively.
+        Load configuration from config.json if it exists.
         
-        Args:
-            obj: Object to convert
-            
-        Returns:
-            Dictionary representation
-        """
-        if isinstance(obj, BaseModel):
-            return {k: self._to_dict(v) for k, v in obj.model_dump().items()}
-        elif isinstance(obj, dict):
-            return {k: self._to_dict(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._to_dict(item) for item in obj]
-        else:
-            return obj
-
-    def _get_env_value(self, var_name: str, convert_func=None, default=None, config_path=None):
-        """
-        Helper function to get and convert environment variables.
+        This is the FILE-BASED CONFIGURATION SOURCE that overrides default values
+        but can be overridden by environment variables.
         
-        Args:
-            var_name: Name of the environment variable
-            convert_func: Optional function to convert the value (str, int, float, etc.)
-            default: Default value if environment variable is not set or conversion fails
-            config_path: List of nested keys to locate the config value (e.g., ["ui", "window_width"])
-            
         Returns:
-            The converted value or default
+            Settings from the file, with defaults for everything it leaves out
         """
-        val = os.getenv(var_name)
-        if val is None:
-            return default
-            
-        if convert_func is None:
-            return val
-            
+        # Read directly rather than checking exists() first; a missing file is the rare case
         try:
-            return convert_func(val)
-        except ValueError:
-            logger.warning("Invalid value for %s: %s", var_name, val)
-            return default
-            
-    def _get_bool_env_value(self, var_name: str, default=None, config_path=None):
-        """
-        Helper function specifically for boolean environment variables.
-        
-        Args:
-            var_name: Name of the environment variable
-            default: Default value if environment variable is not set
-            config_path: List of nested keys to locate the config value
-            
-        Returns:
-            True if value is "true" (case insensitive), False if "false", or default
-        """
-        val = os.getenv(var_name)
-        if val is None:
-            return default
-            
-        if val.lower() == "true":
-            return True
-        elif val.lower() == "false":
-            return False
+            user_config = _read_json(self.config_file)
+        except FileNotFoundError:
+            # Nothing is written here; save() creates the file when there is something to keep
+            logger.debug("No configuration file at %s, using defaults", self.config_file)
+        except (json.JSONDecodeError, IOError) as error:
+            logger.error("Error loading config file: %s", error)
         else:
-            logger.warning("Invalid boolean value for %s: %s", var_name, val)
-            return default
-            
-    def _set_config_value(self, config_path: List[str], value: Any) -> None:
-        """
-        Set a value in the settings object.
-        
-        Args:
-            config_path: List of keys to navigate the nested structure
-            value: Value to set
-        """
-        if not config_path or value is None:
-            return
-            
-        # Start with the settings object
-        current = self.settings
+            # Validation fills in defaults for whatever the file leaves out, so the
+            # defaults are built (and validated) once rather than dumped and merged
+            settings, _ = _validate_file_data(Settings, user_config, self.config_file)
+            logger.info("Loaded configuration from %s", self.config_file)
+            return settings
         
-        # Navigate to the parent object
-        for key in config_path[:-1]:
-            if not hasattr(current, key):
-                logger.warning(f"Config path not found: {key} in {config_path}")
-                return
-            current = getattr(current, key)
-            
-        # Set the value on the parent object
-        last_key = config_path[-1]
-        if hasattr(current, last_key):
-            try:
-                setattr(current, last_key, value)
-                # Update the dictionary representation
-                self.config = self._to_dict(self.settings)
-            except Exception as e:
-                logger.warning(f"Failed to set config value {last_key}: {e}")
-        else:
-            logger.warning(f"Config key not found: {last_key} in {config_path}")
+        return Settings()
 
     def _load_environment_variables(self) -> None:
         """
@@ -436,77 +550,19 @@ class Config:
         - The .env file (loaded by python-dotenv)
         - The actual environment variables set in the system
         """
-        # Define a mapping of environment variables to configuration paths
-        # Format: "ENV_VAR_NAME": (["path", "to", "config"], converter_function)
-        env_var_mapping = {
-            # App settings
-            "APP_NAME": (["app", "name"], None),
-            "DEBUG": (["app", "debug"], self._get_bool_env_value),
-            "LOG_LEVEL": (["app", "log_level"], None),
-            
-            # Model settings
-            "DEFAULT_MODEL": (["model", "default"], None),
-            "OPENAI_MODEL": (["model", "openai", "model"], None),
-            "OPENAI_TEMPERATURE": (["model", "openai", "temperature"], lambda x: float(x)),
-            "OPENAI_MAX_TOKENS": (["model", "openai", "max_tokens"], lambda x: int(x)),
-            
-            # UI settings
-            "THEME": (["ui", "theme"], None),
-            "WINDOW_WIDTH": (["ui", "window_width"], lambda x: int(x)),
-            "WINDOW_HEIGHT": (["ui", "window_height"], lambda x: int(x)),
-            "CODE_HIGHLIGHTING": (["ui", "code_highlighting"], self._get_bool_env_value),
-            "ENABLE_SCREENSHOTS": (["ui", "enable_screenshots"], self._get_bool_env_value),
-            
-            # Session settings
-            "SESSION_PERSISTENCE": (["session", "persistence"], self._get_bool_env_value),
-            "MAX_HISTORY_SESSIONS": (["session", "max_history_sessions"], lambda x: int(x)),
-            "MESSAGE_HISTORY_LIMIT": (["session", "message_history_limit"], lambda x: int(x)),
-            
-            # Security settings
-            "API_KEY_ENCRYPTION": (["security", "api_key_encryption"], self._get_bool_env_value),
-            "CLIPBOARD_AUTO_CLEAR": (["security", "clipboard_auto_clear"], self._get_bool_env_value),
-            
-            # Notification settings
-            "ENABLE_NOTIFICATIONS": (["notifications", "enable"], self._get_bool_env_value),
-            "NOTIFICATION_SOUND": (["notifications", "sound"], self._get_bool_env_value),
-        }
-        
-        # Process each environment variable
-        for env_var, (config_path, converter) in env_var_mapping.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                try:
-                    if converter:
-                        value = converter(value)
-                    self._set_config_value(config_path, value)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid value for {env_var}: {value} - {str(e)}")
-        
-        # Special case for clipboard clear delay with additional validation
-        clear_delay_str = os.getenv("CLIPBOARD_CLEAR_DELAY")
-        if clear_delay_str:
+        env = os.environ
+        settings = self.settings
+        for env_var, converter, set_value in _ENV_SETTINGS:
+            value = env.get(env_var)
+            if not value:
+                continue
             try:
-                # Strip whitespace and comments
-                clean_value = clear_delay_str.split('#')[0].strip()
-                clear_delay = int(clean_value)
-                if clear_delay > 0:
-                    self._set_config_value(["security", "clipboard_clear_delay"], clear_delay)
-                    logger.debug("Set clipboard_clear_delay to %s", clear_delay)
-                else:
-                    msg = "Invalid CLIPBOARD_CLEAR_DELAY value: %s (must be a positive integer)"
-                    logger.warning(msg, clear_delay_str)
-            except ValueError:
-                msg = "Invalid CLIPBOARD_CLEAR_DELAY value: %s (must be a valid integer)"
-                logger.warning(msg, clear_delay_str)
-        
-        # Special case for global shortcut (due to alias field)
-        global_shortcut = os.getenv("GLOBAL_SHORTCUT")
-        if global_shortcut:
-            # Handle the alias field specially
-            if hasattr(self.settings.shortcuts, "global_shortcut"):
-                self.settings.shortcuts.global_shortcut = global_shortcut
-                # Update the dictionary representation
-                self.config = self._to_dict(self.settings)
+                if converter:
+                    value = converter(value)
+            except ValueError as e:
+                logger.warning("Invalid value for %s: %s - %s", env_var, value, e)
+                continue
+            set_value(settings, value)
 
     def _load_api_keys(self) -> APIKeys:
         """
@@ -517,75 +573,51 @@ class Config:
         2. FILE-BASED CONFIGURATION: From api_keys.json
         3. ENVIRONMENT VARIABLES: Override both defaults and file-based config
         """
-        # 1. DEFAULT VALUES SOURCE: Start with default values from APIKeys model
-        api_keys = APIKeys()
+        api_keys = None
         
         # Add debug logging to show the exact path being used
         logger.debug("Attempting to load API keys from: %s", self.api_keys_file)
-        logger.debug("Full absolute path: %s", os.path.abspath(self.api_keys_file))
         
         # 2. FILE-BASED CONFIGURATION SOURCE: Load from api_keys.json
-        if self.api_keys_file.exists():
-            try:
-                with open(self.api_keys_file, 'r', encoding='utf-8') as file_handle:
-                    api_keys_dict = json.load(file_handle)
-                    # Update API keys from file
-                    api_keys = self._update_from_dict(api_keys, api_keys_dict)
-                    logger.info("Loaded API keys from %s", self.api_keys_file)
-                    # Debug: Print providers found (without showing actual keys)
-                    providers = list(api_keys_dict.keys())
-                    logger.debug("Found API providers: %s", providers)
-                    if "openai" in api_keys_dict:
-                        has_key = bool(api_keys_dict["openai"].get("api_key"))
-                        logger.debug("OpenAI API key found: %s", has_key)
-            except (json.JSONDecodeError, IOError) as error:
-                logger.error("Error loading API keys: %s", error)
+        try:
+            api_keys_dict = _read_json(self.api_keys_file)
+        except FileNotFoundError:
+            # The empty defaults stay in memory; save_api_key() creates the file
+            logger.debug("No API keys file at %s, using defaults", self.api_keys_file)
+        except (json.JSONDecodeError, IOError) as error:
+            logger.error("Error loading API keys: %s", error)
+            self._api_keys_file_intact = False
         else:
-            # Create default empty API keys file with proper structure if it doesn't exist
-            default_api_keys = {
-                "openai": {"api_key": ""},
-                "anthropic": {"api_key": ""},
-                "google": {"api_key": "", "project_id": ""},
-                "openrouter": {"api_key": ""},
-                "perplexity": {"api_key": ""},
-                "elevenlabs": {"api_key": ""},
-                "local": {"api_key": "", "model_path": ""}
-            }
-            with open(self.api_keys_file, 'w', encoding='utf-8') as file_handle:
-                json.dump(default_api_keys, file_handle, indent=2)
-            # Set restrictive permissions
-            os.chmod(self.api_keys_file, 0o600)
-            logger.info("Created empty API keys file at %s", self.api_keys_file)
+            # Defaults fill in whatever the file leaves out
+            api_keys, self._api_keys_file_intact = _validate_file_data(
+                APIKeys, api_keys_dict, self.api_keys_file
+            )
+            logger.info("Loaded API keys from %s", self.api_keys_file)
+            # Debug: Print providers found (without showing actual keys)
+            if logger.isEnabledFor(logging.DEBUG) and isinstance(api_keys_dict, dict):
+                logger.debug("Found API providers: %s", list(api_keys_dict))
+                logger.debug("OpenAI API key found: %s", bool(api_keys.openai.api_key))
+        
+        # 1. DEFAULT VALUES SOURCE: Without a usable file, start from the APIKeys defaults
+        if api_keys is None:
+            api_keys = APIKeys()
         
         # 3. ENVIRONMENT VARIABLES SOURCE: Override with environment variables
-        # Define a mapping of environment variables to API key fields
-        env_var_mapping = {
-            "OPENAI_API_KEY": ("openai", "api_key"),
-            "ANTHROPIC_API_KEY": ("anthropic", "api_key"),
-            "GOOGLE_API_KEY": ("google", "api_key"),
-            "GOOGLE_PROJECT_ID": ("google", "project_id"),
-            "OPENROUTER_API_KEY": ("openrouter", "api_key"),
-            "PERPLEXITY_API_KEY": ("perplexity", "api_key"),
-            "ELEVENLABS_API_KEY": ("elevenlabs", "api_key")
-        }
-        
-        # Process each environment variable
-        for env_var, (provider, field) in env_var_mapping.items():
-            value = os.getenv(env_var)
+        env = os.environ
+        for env_var, provider, field in _API_KEY_ENV_VARS:
+            value = env.get(env_var)
             if value:
-                provider_obj = getattr(api_keys, provider, None)
-                if provider_obj and hasattr(provider_obj, field):
-                    setattr(provider_obj, field, value)
-                    logger.debug(f"Set {provider}.{field} from environment variable {env_var}")
+                setattr(getattr(api_keys, provider), field, value)
+                logger.debug("Set %s.%s from environment variable %s", provider, field, env_var)
         
         return api_keys
 
     def _configure_logging(self) -> None:
         """Configure logging based on loaded configuration."""
         log_level_str = self.settings.app.log_level
-        log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+        log_level = _LOG_LEVELS.get(log_level_str.upper(), logging.INFO)
+        # The module logger (and every other schmagent logger) inherits the root level
         logging.getLogger().setLevel(log_level)
-        logger.setLevel(log_level)
         logger.debug("Logging configured with level: %s", log_level_str)
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
@@ -605,6 +637,14 @@ class Config:
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """Get an API key for the specified provider."""
+        # API keys only change through save_api_key, which drops the cached entry
+        api_key = self._api_key_cache.get(provider, _MISSING)
+        if api_key is _MISSING:
+            api_key = self._api_key_cache[provider] = self._lookup_api_key(provider)
+        return api_key
+
+    def _lookup_api_key(self, provider: str) -> Optional[str]:
+        """Look up an API key for the specified provider, logging what was found."""
         logger.debug("Looking for API key for provider: %s", provider)
         
         try:
@@ -629,19 +669,18 @@ class Config:
     def get_provider_config(self, provider: str) -> Dict[str, Any]:
         """Get the complete configuration for a provider, including API keys and additional settings."""
         try:
-            # Get model configuration
+            # Get model configuration ("default" is a plain field, not a provider)
             model_config = {}
-            if hasattr(self.settings.model, provider):
-                provider_model = getattr(self.settings.model, provider)
-                model_config = self._to_dict(provider_model)
+            provider_model = getattr(self.settings.model, provider, None)
+            if isinstance(provider_model, BaseModel):
+                model_config = provider_model.model_dump()
             
             # Get API key configuration (excluding the actual API key)
             provider_config = {}
-            if hasattr(self.api_keys, provider):
-                provider_obj = getattr(self.api_keys, provider)
-                provider_dict = self._to_dict(provider_obj)
+            provider_obj = getattr(self.api_keys, provider, None)
+            if isinstance(provider_obj, BaseModel):
                 # Don't include the API key directly
-                provider_config = {k: v for k, v in provider_dict.items() if k != "api_key"}
+                provider_config = provider_obj.model_dump(exclude={"api_key"})
             
             # Merge configurations
             result = {**model_config, **provider_config}
@@ -651,13 +690,14 @@ class Config:
             return {}
 
     def save(self) -> None:
-        """Save current configuration to config.json."""
+        """Save current configuration to config.json, creating the file if needed."""
         try:
-            # Convert settings to dictionary
-            config_dict = self._to_dict(self.settings)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as file_handle:
-                json.dump(config_dict, file_handle, indent=2)
+            # config.json is meant to be edited by hand, so it is written indented;
+            # api_keys.json is maintained by the app and scripts, so it stays compact
+            data = self.settings.model_dump_json(indent=2).encode("utf-8")
+            _write_atomic(self.config_file, data, 0o644)
+            # The settings may have changed since the config view was built
+            self._config = None
             logger.info("Saved configuration to %s", self.config_file)
         except IOError as error:
             logger.error("Error saving configuration: %s", error)
@@ -667,6 +707,10 @@ class Config:
         """
         Save an API key and optional additional configuration to the secure api_keys.json file.
         
+        The file is created on the first save; until then the defaults live only in memory.
+        Nothing is written if the existing file could not be read or had invalid entries,
+        since the keys it holds would be overwritten.
+        
         Args:
             provider: The provider name (e.g., 'openai', 'anthropic')
             api_key: The API key string
@@ -674,25 +718,29 @@ class Config:
         """
         try:
             # Get the provider object
-            if hasattr(self.api_keys, provider):
+            if provider in APIKeys.model_fields:
                 provider_obj = getattr(self.api_keys, provider)
+                if not self._api_keys_file_intact:
+                    logger.error("Not saving API key for %s: %s could not be fully loaded; "
+                                 "fix or remove it first", provider, self.api_keys_file)
+                    return
                 
-                # Set the API key
-                provider_obj.api_key = api_key
-                
-                # Add any additional configuration
+                # The API key plus any additional configuration the provider has fields for
+                update = {"api_key": api_key}
                 if additional_config:
-                    for key, value in additional_config.items():
-                        if hasattr(provider_obj, key):
-                            setattr(provider_obj, key, value)
+                    fields = type(provider_obj).model_fields
+                    update.update((k, v) for k, v in additional_config.items() if k in fields)
                 
-                # Save to file
-                api_keys_dict = self._to_dict(self.api_keys)
+                # Save to file; the in-memory keys only change once the write succeeded
+                api_keys = self.api_keys.model_copy(
+                    update={provider: provider_obj.model_copy(update=update)}
+                )
                 
-                with open(self.api_keys_file, 'w', encoding='utf-8') as file_handle:
-                    json.dump(api_keys_dict, file_handle, indent=2)
-                # Ensure restrictive permissions
-                os.chmod(self.api_keys_file, 0o600)
+                # Restrictive permissions are set before the file replaces the old one
+                _write_atomic(self.api_keys_file, api_keys.model_dump_json().encode("utf-8"), 0o600)
+                self._api_keys = api_keys
+                self._api_key_cache.pop(provider, None)
+                self.__dict__.pop("_available_models", None)
                 logger.info("Saved API key and configuration for %s", provider)
             else:
                 logger.error("Unknown provider: %s", provider)
@@ -707,10 +755,13 @@ class Config:
             A dictionary with provider names as keys and boolean values 
             indicating whether a valid API key exists for that provider.
         """
-        return {
-            provider: bool(self.get_api_key(provider))
-            for provider in self._to_dict(self.api_keys).keys()
-        }
+        return dict(self._available_models)
+
+    @cached_property
+    def _available_models(self) -> Dict[str, bool]:
+        """Provider availability, computed once and reset by save_api_key."""
+        # Read the keys directly; get_api_key would log (and warn) once per provider
+        return {provider: bool(keys.api_key) for provider, keys in self.api_keys}
         
     def get_model_details(self, provider: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -722,11 +773,22 @@ class Config:
         Returns:
             Dictionary with model configurations
         """
-        model_config = self._to_dict(self.settings.model)
+        model_config = self.settings.model.model_dump()
         if provider:
-            return dict(model_config.get(provider, {}))
-        return dict(model_config)
+            return model_config.get(provider, {})
+        return model_config
+
+
+def get_config() -> Config:
+    """Return the shared Config instance, creating it on first use."""
+    instance = globals().get("config")
+    if instance is None:
+        instance = globals()["config"] = Config()
+    return instance
 
 
-# Create a singleton instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Create the shared `config` instance lazily, so importing this module does no I/O."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")